@@ -5,21 +5,48 @@ Searches for new jobs, updates the dashboard, and pushes to GitHub Pages.
 Runs daily via macOS launchd (8 AM + 6 PM CT).
 """
 
+import atexit
 import os
+import hashlib
 import sys
 import json
-import re
 import subprocess
+import threading
 import urllib.request
 import urllib.parse
-import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from lxml import etree as ET
+    # Feed XML is untrusted: never expand entities or fetch external resources
+    _ITERPARSE_KWARGS = {"resolve_entities": False, "no_network": True}
+except ImportError:
+    import xml.etree.ElementTree as ET
+    _ITERPARSE_KWARGS = {}
+
+try:
+    import requests
+except ImportError:
+    requests = None
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 # === CONFIG ===
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 DASHBOARD_PATH = os.path.join(SCRIPT_DIR, "index.html")
 DATA_PATH = os.path.join(SCRIPT_DIR, "jobs_data.json")
+SCORES_PATH = os.path.join(SCRIPT_DIR, "scores_cache.json")
 LOG_PATH = os.path.join(os.path.expanduser("~"), "Desktop", "job_search_log.txt")
+HTTP_HEADERS = {"User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7)"}
 
 # Search queries
 SEARCH_QUERIES = [
@@ -34,6 +61,15 @@ SEARCH_QUERIES = [
     "Head Financial Planning Analysis remote",
 ]
 
+# Shared keep-alive session when requests is installed; the pool is sized so
+# every concurrent search gets its own reusable connection.
+if requests is not None:
+    _SESSION = requests.Session()
+    _SESSION.headers.update(HTTP_HEADERS)
+    _SESSION.mount("https://", requests.adapters.HTTPAdapter(pool_maxsize=len(SEARCH_QUERIES)))
+else:
+    _SESSION = None
+
 # Target companies to check
 TARGET_COMPANIES = [
     "Stripe", "PayPal", "Block", "Brex", "Ramp", "Chime", "Plaid",
@@ -53,16 +89,91 @@ TITLE_KEYWORDS = {
     "automation": 8, "data": 5, "ai": 8, "digital": 7,
 }
 
+# Lowercased once at import so scoring only does substring checks
+_TITLE_KEYWORDS_LOWER = tuple((k.lower(), v) for k, v in TITLE_KEYWORDS.items())
+_TARGET_COMPANIES_LOWER = tuple(c.lower() for c in TARGET_COMPANIES)
+
+# With pyahocorasick installed, all keywords (and all companies) are matched in
+# one pass over the string instead of one scan per keyword.
+if ahocorasick is not None:
+    _TITLE_AC = ahocorasick.Automaton()
+    for _kw, _pts in _TITLE_KEYWORDS_LOWER:
+        _TITLE_AC.add_word(_kw, (_kw, _pts))
+    _TITLE_AC.make_automaton()
+    _COMPANY_AC = ahocorasick.Automaton()
+    for _tc in _TARGET_COMPANIES_LOWER:
+        _COMPANY_AC.add_word(_tc, _tc)
+    _COMPANY_AC.make_automaton()
+else:
+    _TITLE_AC = _COMPANY_AC = None
+
+# Fit scores memoized across runs, keyed by lowercased (title, company, location).
+# Dict order tracks recency (hits move to the end) and only the most recent
+# _SCORE_CACHE_MAX entries are persisted. The config hash invalidates the
+# persisted cache whenever the scoring inputs change; bump SCORING_VERSION
+# whenever the scoring logic in _score/_title_points changes.
+SCORING_VERSION = 1
+_SCORE_CACHE = {}
+_SCORE_CACHE_MAX = 4096
+_SCORE_CONFIG = hashlib.blake2b(
+    json.dumps([SCORING_VERSION, TITLE_KEYWORDS, TARGET_COMPANIES], sort_keys=True).encode("utf-8"),
+    digest_size=8,
+).hexdigest()
+
+
+def _dumps(obj, compact=False):
+    """Serialize obj as JSON bytes (indented unless compact), using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj) if compact else orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    # ensure_ascii=False matches orjson's raw UTF-8 so both paths write identical bytes
+    if compact:
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _file_digest(path):
+    """Return the blake2b digest of a file, read in chunks."""
+    h = hashlib.blake2b()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.digest()
+
+
+def write_if_changed(path, data):
+    """Write bytes to path unless the file already holds them. Returns True if written."""
+    try:
+        if (os.path.getsize(path) == len(data)
+                and _file_digest(path) == hashlib.blake2b(data).digest()):
+            return False
+    except OSError:
+        pass
+    with open(path, "wb") as f:
+        f.write(data)
+    return True
+
+
+# Searches run on worker threads, so serialize writes to stdout + log file
+_LOG_LOCK = threading.Lock()
+
+# Log file is opened once (line-buffered) and kept for the life of the process
+try:
+    _LOG_FH = open(LOG_PATH, "a", buffering=1)
+    atexit.register(_LOG_FH.close)
+except OSError:
+    _LOG_FH = None
+
 
 def log(msg):
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     line = f"[{timestamp}] {msg}"
-    print(line)
-    try:
-        with open(LOG_PATH, "a") as f:
-            f.write(line + "\n")
-    except Exception:
-        pass
+    with _LOG_LOCK:
+        print(line)
+        if _LOG_FH is not None:
+            try:
+                _LOG_FH.write(line + "\n")
+            except Exception:
+                pass
 
 
 def search_indeed_rss(query, limit=25):
@@ -71,48 +182,68 @@ def search_indeed_rss(query, limit=25):
     try:
         encoded = urllib.parse.quote(query)
         url = f"https://www.indeed.com/rss?q={encoded}&l=Remote&sort=date&limit={limit}"
-        req = urllib.request.Request(url, headers={
-            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7)"
-        })
-        with urllib.request.urlopen(req, timeout=15) as resp:
-            xml_data = resp.read().decode("utf-8")
-        root = ET.fromstring(xml_data)
-        for item in root.findall(".//item"):
-            title = item.findtext("title", "").strip()
-            link = item.findtext("link", "").strip()
-            pub_date = item.findtext("pubDate", "").strip()
-            # Extract company from title (usually "Job Title - Company")
-            parts = title.rsplit(" - ", 1)
-            job_title = parts[0].strip() if parts else title
-            company = parts[1].strip() if len(parts) > 1 else "Unknown"
-            results.append({
-                "title": job_title,
-                "company": company,
-                "link": link,
-                "pubDate": pub_date,
-                "source": "indeed",
-            })
+        if _SESSION is not None:
+            with _SESSION.get(url, timeout=15, stream=True) as resp:
+                resp.raise_for_status()
+                resp.raw.decode_content = True
+                results = parse_rss_items(resp.raw)
+        else:
+            req = urllib.request.Request(url, headers=HTTP_HEADERS)
+            with urllib.request.urlopen(req, timeout=15) as resp:
+                results = parse_rss_items(resp)
     except Exception as e:
         log(f"  Search failed for '{query}': {e}")
     return results
 
 
+def parse_rss_items(stream):
+    """Parse job results from an RSS stream."""
+    results = []
+    # Stream the raw bytes and handle each <item> as soon as it closes; the
+    # parser honours the XML declaration's encoding, so no decode pass is needed
+    for _, item in ET.iterparse(stream, events=("end",), **_ITERPARSE_KWARGS):
+        if item.tag != "item":
+            continue
+        title = item.findtext("title", "").strip()
+        link = item.findtext("link", "").strip()
+        pub_date = item.findtext("pubDate", "").strip()
+        item.clear()
+        # Extract company from title (usually "Job Title - Company")
+        parts = title.rsplit(" - ", 1)
+        job_title = parts[0].strip() if parts else title
+        company = parts[1].strip() if len(parts) > 1 else "Unknown"
+        results.append({
+            "title": job_title,
+            "company": company,
+            "link": link,
+            "pubDate": pub_date,
+            "source": "indeed",
+        })
+    return results
+
+
 def calculate_fit_score(title, company, location=""):
     """Calculate fit score 0-100 based on title/company/location keywords."""
+    key = (title.lower(), company.lower(), location.lower())
+    score = _SCORE_CACHE.pop(key, None)
+    if score is None:
+        score = _score(*key)
+    _SCORE_CACHE[key] = score
+    return score
+
+
+def _score(title_lower, company_lower, loc_lower):
+    """Score already-lowercased inputs; see calculate_fit_score."""
     score = 40  # base
-    title_lower = title.lower()
-    company_lower = company.lower()
-    loc_lower = location.lower()
 
-    for keyword, points in TITLE_KEYWORDS.items():
-        if keyword in title_lower:
-            score += points
+    score += _title_points(title_lower)
 
     # Company bonus
-    for tc in TARGET_COMPANIES:
-        if tc.lower() in company_lower:
+    if _COMPANY_AC is not None:
+        if next(_COMPANY_AC.iter(company_lower), None) is not None:
             score += 8
-            break
+    elif any(tc in company_lower for tc in _TARGET_COMPANIES_LOWER):
+        score += 8
 
     # Remote bonus
     if "remote" in loc_lower or "remote" in title_lower:
@@ -121,21 +252,72 @@ def calculate_fit_score(title, company, location=""):
     return min(score, 100)
 
 
+def _title_points(title_lower):
+    """Sum keyword points for a title, counting each keyword at most once."""
+    if _TITLE_AC is None:
+        return sum(points for keyword, points in _TITLE_KEYWORDS_LOWER if keyword in title_lower)
+
+    points = 0
+    seen = set()
+    for _, (keyword, kw_points) in _TITLE_AC.iter(title_lower):
+        if keyword not in seen:
+            seen.add(keyword)
+            points += kw_points
+    return points
+
+
+def load_score_cache():
+    """Seed the fit-score memo from disk, ignoring it if scoring config changed."""
+    try:
+        with open(SCORES_PATH, "r") as f:
+            data = json.load(f)
+        if data.get("config") == _SCORE_CONFIG:
+            for title, company, location, score in data.get("scores", []):
+                _SCORE_CACHE[(title, company, location)] = score
+    except Exception:
+        pass
+
+
+def save_score_cache():
+    """Persist the most recently used fit scores next to the jobs data."""
+    recent = list(_SCORE_CACHE.items())[-_SCORE_CACHE_MAX:]
+    scores = [[*key, score] for key, score in recent]
+    data = {"config": _SCORE_CONFIG, "scores": scores}
+    write_if_changed(SCORES_PATH, json.dumps(data).encode("utf-8"))
+
+
 def load_existing_data():
-    """Load existing jobs from JSON data file."""
-    if os.path.exists(DATA_PATH):
-        try:
-            with open(DATA_PATH, "r") as f:
-                return json.load(f)
-        except Exception:
-            pass
-    return []
+    """Load existing jobs and the next free job id from JSON data file."""
+    if not os.path.exists(DATA_PATH):
+        return [], 101
+
+    # Let read/schema errors propagate: falling back to an empty list here
+    # would make save_data overwrite every tracked job.
+    try:
+        with open(DATA_PATH, "r") as f:
+            data = json.load(f)
+        if isinstance(data, list):
+            # Old-style file: a bare list of jobs without a stored next_id
+            jobs, next_id = data, None
+        else:
+            # Also accepts the dashboard's {jobs, saved} progress export
+            jobs, next_id = data["jobs"], data.get("next_id")
+    except Exception as e:
+        log(f"ERROR: Could not load {DATA_PATH}: {e}")
+        raise
+
+    if next_id is None:
+        # One-time migration: derive next_id and drop the isNew flag, which the
+        # dashboard now computes from "discovered" itself
+        for j in jobs:
+            j.pop("isNew", None)
+        next_id = max([j.get("id", 0) for j in jobs], default=100) + 1
+    return jobs, next_id
 
 
-def save_data(jobs):
-    """Save jobs to JSON data file."""
-    with open(DATA_PATH, "w") as f:
-        json.dump(jobs, f, indent=2)
+def save_data(jobs, next_id):
+    """Save jobs and next_id to JSON data file."""
+    write_if_changed(DATA_PATH, _dumps({"next_id": next_id, "jobs": jobs}))
 
 
 def deduplicate_key(title, company):
@@ -145,21 +327,21 @@ def deduplicate_key(title, company):
 
 def search_all():
     """Run all searches and return new jobs."""
-    existing = load_existing_data()
-    existing_keys = set()
-    for j in existing:
-        existing_keys.add(deduplicate_key(j.get("title", ""), j.get("company", "")))
+    existing, next_id = load_existing_data()
+    existing_keys = {deduplicate_key(j.get("title", ""), j.get("company", "")) for j in existing}
 
     new_jobs = []
     today = datetime.now().strftime("%m/%d/%Y")
-    next_id = max([j.get("id", 0) for j in existing], default=100) + 1
 
     log(f"Running {len(SEARCH_QUERIES)} search queries...")
 
-    for i, query in enumerate(SEARCH_QUERIES, 1):
-        log(f"  [{i}/{len(SEARCH_QUERIES)}] Searching: {query}")
-        results = search_indeed_rss(query)
-        log(f"    Found {len(results)} results")
+    # Fetches are network-bound, so run them concurrently; map() keeps
+    # query order so dedup/scoring below stays deterministic.
+    with ThreadPoolExecutor(max_workers=len(SEARCH_QUERIES)) as ex:
+        results_per_query = list(ex.map(search_indeed_rss, SEARCH_QUERIES))
+
+    for i, (query, results) in enumerate(zip(SEARCH_QUERIES, results_per_query), 1):
+        log(f"  [{i}/{len(SEARCH_QUERIES)}] {query}: {len(results)} results")
 
         for r in results:
             key = deduplicate_key(r["title"], r["company"])
@@ -183,18 +365,13 @@ def search_all():
                 "reason": f"Found via Indeed search: '{query}'. Auto-scored based on title/company keywords.",
                 "discovered": today,
                 "source": "general",
-                "isNew": True,
                 "status": "not-applied",
                 "notes": "",
             })
             next_id += 1
 
-    # Mark old jobs as no longer new (if discovered > 2 days ago)
-    for j in existing:
-        j["isNew"] = j.get("discovered", "") == today
-
     all_jobs = existing + new_jobs
-    save_data(all_jobs)
+    save_data(all_jobs, next_id)
     return all_jobs, len(new_jobs)
 
 
@@ -207,23 +384,23 @@ def rebuild_dashboard(jobs):
     with open(DASHBOARD_PATH, "r") as f:
         html = f.read()
 
-    # Replace the JOBS array in the HTML
-    jobs_json = json.dumps(jobs, indent=2)
-
-    # Find and replace the JOBS constant
-    pattern = r'const JOBS = \[.*?\];'
-    replacement = f'const JOBS = {jobs_json};'
+    # Replace the JOBS array in the HTML (compact; jobs_data.json keeps the indented copy)
+    jobs_json = _dumps(jobs, compact=True).decode("utf-8")
 
-    new_html = re.sub(pattern, replacement, html, flags=re.DOTALL)
-
-    if new_html == html:
+    # Find and splice in the JOBS constant
+    try:
+        start = html.index("const JOBS = [")
+        end = html.index("];", start) + 2
+    except ValueError:
         log("WARNING: Could not find JOBS array in HTML to update")
         return False
 
-    with open(DASHBOARD_PATH, "w") as f:
-        f.write(new_html)
+    new_html = html[:start] + f"const JOBS = {jobs_json};" + html[end:]
 
-    log("Dashboard HTML updated with latest data")
+    if write_if_changed(DASHBOARD_PATH, new_html.encode("utf-8")):
+        log("Dashboard HTML updated with latest data")
+    else:
+        log("Dashboard HTML unchanged")
     return True
 
 
@@ -233,16 +410,18 @@ def git_push():
         os.chdir(SCRIPT_DIR)
         now = datetime.now().strftime("%Y-%m-%d %H:%M")
 
-        # Check if there are changes
+        # Check if there are changes (status refreshes the index and lists untracked files)
         result = subprocess.run(["git", "status", "--porcelain"],
                                 capture_output=True, text=True, cwd=SCRIPT_DIR)
         if not result.stdout.strip():
             log("No changes to commit")
             return True
 
-        subprocess.run(["git", "add", "-A"], cwd=SCRIPT_DIR, check=True)
+        # Only stage explicitly when there are new files; otherwise -a suffices
+        if any(line.startswith("??") for line in result.stdout.splitlines()):
+            subprocess.run(["git", "add", "-A"], cwd=SCRIPT_DIR, check=True)
         subprocess.run(
-            ["git", "commit", "-m", f"Auto-update: {now}"],
+            ["git", "commit", "-am", f"Auto-update: {now}"],
             cwd=SCRIPT_DIR, check=True
         )
         subprocess.run(["git", "push"], cwd=SCRIPT_DIR, check=True)
@@ -260,7 +439,9 @@ def main():
     log("=" * 60)
 
     # 1. Search for new jobs
+    load_score_cache()
     all_jobs, new_count = search_all()
+    save_score_cache()
     log(f"Total jobs: {len(all_jobs)} | New today: {new_count}")
 
     # 2. Rebuild dashboard